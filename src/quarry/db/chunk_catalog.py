@@ -86,6 +86,36 @@ class ChunkCatalog:
 
         return docs
 
+    def document_timestamps(
+        self,
+        collection_filter: str | None = None,
+    ) -> dict[str, str]:
+        """Map each document name to its newest ingestion timestamp.
+
+        A two-column projection for dedup paths (sitemap lastmod checks)
+        that only need name -> timestamp; skips the page grouping and full
+        ``DocumentSummary`` rows that ``list_documents`` materializes.
+        """
+        if TABLE_NAME not in self._db.list_tables().tables:
+            return {}
+
+        table = self._db.open_table(TABLE_NAME)
+        query = (
+            table.search()
+            .limit(_FULL_SCAN_LIMIT)
+            .select(["document_name", "ingestion_timestamp"])
+        )
+        if collection_filter:
+            query = query.where(f"collection = '{escape_sql(collection_filter)}'")
+
+        newest: dict[str, str] = {}
+        for row in query.to_list():
+            name = str(row["document_name"])
+            timestamp = str(row["ingestion_timestamp"])
+            if timestamp > newest.get(name, ""):
+                newest[name] = timestamp
+        return newest
+
     def list_collections(self) -> list[CollectionSummary]:
         """List all collections with document and chunk counts."""
         if TABLE_NAME not in self._db.list_tables().tables:
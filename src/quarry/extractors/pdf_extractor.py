@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
@@ -19,6 +21,13 @@ logger = logging.getLogger(__name__)
 
 MIN_TEXT_CHARS_FOR_TEXT_PAGE = 50
 
+# fitz releases the GIL while parsing content streams, so classifying a big
+# PDF parallelizes well — but a fitz.Document is not thread-safe, so each
+# worker opens its own handle. Below this page count the extra opens cost
+# more than they save.
+_PARALLEL_CLASSIFY_MIN_PAGES = 64
+_PARALLEL_CLASSIFY_WORKERS = 4
+
 
 class PdfExtractor:
     """Extract pages from PDF files.
@@ -59,60 +68,134 @@ class PdfExtractor:
             a.page_number for a in analyses if a.page_type == PageType.IMAGE
         ]
 
-        all_pages: list[PageContent] = []
+        all_pages = self._extract_phases(
+            path, text_page_nums, image_page_nums, total_pages, document_name
+        )
+        # Both phases return their pages pre-sorted, so an indexed-slot merge
+        # is O(N) with no per-comparison callback; OCR-degraded pages (absent
+        # from the result) simply leave their slot empty.
+        slots: list[PageContent | None] = [None] * total_pages
+        for page in all_pages:
+            slots[page.page_number - 1] = page
+        return [page for page in slots if page is not None]
+
+    def _extract_phases(
+        self,
+        path: Path,
+        text_page_nums: list[int],
+        image_page_nums: list[int],
+        total_pages: int,
+        document_name: str,
+    ) -> list[PageContent]:
+        """Run text extraction and OCR, overlapping them on mixed PDFs.
 
+        The two phases are independent (each opens its own document handle),
+        so on a mixed PDF text extraction runs on a worker thread while OCR —
+        the dominant phase — runs on the calling thread: wall time becomes
+        max(text, ocr) instead of the sum. Single-phase PDFs stay inline.
+        """
+        extract_text = partial(
+            extract_text_pages,
+            path,
+            text_page_nums,
+            total_pages,
+            document_name=document_name,
+        )
+        run_ocr = partial(
+            self._ocr.ocr_document,
+            path,
+            image_page_nums,
+            total_pages,
+            document_name=document_name,
+        )
+        if text_page_nums and image_page_nums:
+            with ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pdf-text"
+            ) as pool:
+                text_future = pool.submit(extract_text)
+                ocr_pages = run_ocr()
+                return [*text_future.result(), *ocr_pages]
         if text_page_nums:
-            all_pages.extend(
-                extract_text_pages(
-                    path, text_page_nums, total_pages, document_name=document_name
-                )
-            )
-
+            return extract_text()
         if image_page_nums:
-            all_pages.extend(
-                self._ocr.ocr_document(
-                    path,
-                    image_page_nums,
-                    total_pages,
-                    document_name=document_name,
-                )
-            )
-
-        all_pages.sort(key=lambda p: p.page_number)
-        return all_pages
+            return run_ocr()
+        return []
 
     @staticmethod
     def _classify_pages(pdf_path: Path) -> list[PageAnalysis]:
-        """Classify each page as TEXT or IMAGE based on extractable text content."""
-        results: list[PageAnalysis] = []
+        """Classify each page as TEXT or IMAGE based on extractable text content.
 
+        Large PDFs are classified in parallel: the page range is split into
+        contiguous slices and each worker thread opens its own document
+        handle over the same file (separate handles are safe; one shared
+        handle is not).
+        """
         with fitz.open(pdf_path) as doc:
-            logger.debug("Opened %s: %d pages", pdf_path.name, len(doc))
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                raw = page.get_text()
-                text = str(raw).strip()
-                text_length = len(text)
-
-                page_type = (
-                    PageType.TEXT
-                    if text_length >= MIN_TEXT_CHARS_FOR_TEXT_PAGE
-                    else PageType.IMAGE
-                )
-                logger.debug(
-                    "Page %d: %s (%d chars, threshold=%d)",
-                    page_num + 1,
-                    page_type.value,
-                    text_length,
-                    MIN_TEXT_CHARS_FOR_TEXT_PAGE,
-                )
+            total = len(doc)
+            logger.debug("Opened %s: %d pages", pdf_path.name, total)
+            if total < _PARALLEL_CLASSIFY_MIN_PAGES:
+                return PdfExtractor._classify_range(doc, range(total))
+
+        step = -(-total // _PARALLEL_CLASSIFY_WORKERS)  # ceil division
+        slices = [
+            range(start, min(start + step, total)) for start in range(0, total, step)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=len(slices), thread_name_prefix="pdf-classify"
+        ) as pool:
+            parts = pool.map(partial(PdfExtractor._classify_slice, pdf_path), slices)
+        return [analysis for part in parts for analysis in part]
 
-                results.append(
-                    PageAnalysis(
-                        page_number=page_num + 1,
-                        page_type=page_type,
-                        text_length=text_length,
-                    )
-                )
+    @staticmethod
+    def _classify_slice(pdf_path: Path, pages: range) -> list[PageAnalysis]:
+        """Classify one contiguous page slice via a worker-private document."""
+        with fitz.open(pdf_path) as doc:
+            return PdfExtractor._classify_range(doc, pages)
 
+    @staticmethod
+    def _classify_range(doc: fitz.Document, pages: range) -> list[PageAnalysis]:
+        """Classify the given 0-indexed pages of an open document, in order."""
+        results: list[PageAnalysis] = []
+        for page_num in pages:
+            text_length = PdfExtractor._page_text_length(
+                doc[page_num], MIN_TEXT_CHARS_FOR_TEXT_PAGE
+            )
+            page_type = (
+                PageType.TEXT
+                if text_length >= MIN_TEXT_CHARS_FOR_TEXT_PAGE
+                else PageType.IMAGE
+            )
+            logger.debug(
+                "Page %d: %s (%d chars, threshold=%d)",
+                page_num + 1,
+                page_type.value,
+                text_length,
+                MIN_TEXT_CHARS_FOR_TEXT_PAGE,
+            )
+            results.append(
+                PageAnalysis(
+                    page_number=page_num + 1,
+                    page_type=page_type,
+                    text_length=text_length,
+                )
+            )
         return results
+
+    @staticmethod
+    def _page_text_length(page: fitz.Page, threshold: int) -> int:
+        """Count extractable text characters, stopping once *threshold* is hit.
+
+        Classification only needs to know whether a page clears the threshold,
+        so this iterates ``get_text("blocks")`` and returns early instead of
+        materializing (and stripping a second copy of) the full page text.
+        Image blocks (block type 1) are skipped. The returned count saturates
+        at the first block that crosses the threshold.
+        """
+        count = 0
+        for block in page.get_text("blocks"):
+            if block[6] != 0:  # 0 = text block, 1 = image block
+                continue
+            count += len(str(block[4]).strip())
+            if count >= threshold:
+                break
+        return count
@@ -15,6 +15,7 @@ from quarry.ingestion.pipeline import (
     ingest_auto,
     ingest_content,
     ingest_document,
+    ingest_documents,
     ingest_sitemap,
     ingest_url,
 )
@@ -39,6 +40,7 @@ __all__ = [
     "ingest_auto",
     "ingest_content",
     "ingest_document",
+    "ingest_documents",
     "ingest_sitemap",
     "ingest_url",
     "read_text_with_fallback",
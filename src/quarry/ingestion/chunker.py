@@ -90,8 +90,8 @@ def _split_text(
         sentence_len = len(sentence)
 
         if current_len + sentence_len > max_chars and current:
-            chunks.append(" ".join(current))
             overlap_text = " ".join(current)
+            chunks.append(overlap_text)
             # Overlap preserves context across chunk boundaries. Take the tail
             # of the previous chunk; break at a space to avoid mid-word splits.
             if len(overlap_text) > overlap_chars:
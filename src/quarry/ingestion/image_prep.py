@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import io
 import logging
+import math
 from typing import TYPE_CHECKING, Self, final
 
+from PIL import Image, ImageOps
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -13,6 +16,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Source format -> (output format, save kwargs) for formats the OCR engine
+# cannot take as-is; anything absent keeps its own format (PNG fallback for
+# images PIL could not identify). New conversions (HEIC, AVIF, ...) are one
+# entry here, not another branch. The PNG conversions favor encode speed
+# over size (compress_level=1): the bytes feed the in-process OCR decoder
+# and are discarded, so the default level-6 deflate — the dominant cost of
+# BMP/WebP prep — buys nothing.
+_FORMAT_CONVERSIONS: dict[str, tuple[str, dict[str, int]]] = {
+    "MPO": ("JPEG", {"quality": 95}),
+    "BMP": ("PNG", {"compress_level": 1}),
+    "WEBP": ("PNG", {"compress_level": 1}),
+}
+
+_EXIF_ORIENTATION_TAG = 0x0112
+
 
 @final
 class ImagePreparer:
@@ -21,7 +39,8 @@ class ImagePreparer:
     Format conversion: MPO -> JPEG, BMP/WebP -> PNG, with EXIF transpose.
     Size reduction: when the byte budget is positive and the encoded image
     exceeds it, lossless formats are re-encoded as JPEG (quality 95); if still
-    too large, dimensions are halved up to five times.
+    too large, one resize at the sqrt-predicted scale (plus at most one
+    corrective half-step) brings it under budget.
     """
 
     __slots__ = ("_image_path", "_max_bytes", "_needs_conversion")
@@ -49,40 +68,84 @@ class ImagePreparer:
             if len(raw) <= self._max_bytes:
                 return raw
 
-        from PIL import Image, ImageOps  # noqa: PLC0415
-
         with Image.open(self._image_path) as im:
-            img = ImageOps.exif_transpose(im)
-
-            out_fmt: str
-            save_kw: dict[str, int]
-            if im.format == "MPO":
-                out_fmt, save_kw = "JPEG", {"quality": 95}
-            elif im.format in ("BMP", "WEBP"):
-                out_fmt, save_kw = "PNG", {}
-            else:
-                out_fmt, save_kw = im.format or "PNG", {}
+            self._draft_oversized_jpeg(im)
+            img = self._oriented(im)
 
+            out_fmt, save_kw = _FORMAT_CONVERSIONS.get(
+                im.format or "", (im.format or "PNG", {})
+            )
             return self._encode_to_fit(img, out_fmt, save_kw)
 
+    @staticmethod
+    def _oriented(im: PILImage) -> PILImage:
+        """Apply the EXIF orientation, skipping the no-op copy for upright images.
+
+        Most photos carry orientation 1 or no tag at all, and
+        ``exif_transpose`` still duplicates the full raster for them; those
+        pass through untouched. Rotated/mirrored orientations transpose as
+        before.
+        """
+        if im.getexif().get(_EXIF_ORIENTATION_TAG, 1) == 1:
+            return im
+        return ImageOps.exif_transpose(im)
+
+    def _draft_oversized_jpeg(self, im: PILImage) -> None:
+        """Pre-shrink a clearly oversized JPEG/MPO in the DCT domain.
+
+        ``draft()`` has libjpeg decode at 1/2, 1/4, or 1/8 scale directly, so
+        full-resolution pixels are never materialized. Only engages past 2x
+        the budget — a mildly oversized JPEG often fits after the quality-95
+        re-encode alone, and draft picks the nearest power-of-two at or above
+        the requested size, so resolution is never cut more than needed.
+        ``_encode_to_fit`` still verifies the final bytes against the budget.
+        """
+        if self._max_bytes <= 0 or im.format not in ("JPEG", "MPO"):
+            return
+        encoded = self._image_path.stat().st_size
+        if encoded <= self._max_bytes * 2:
+            return
+        scale = math.sqrt(self._max_bytes / encoded)
+        # mode=None keeps the image's own mode; draft()'s first parameter is
+        # a target *mode* ("L"/"YCbCr"), not a format name.
+        im.draft(
+            None,
+            (max(1, int(im.width * scale)), max(1, int(im.height * scale))),
+        )
+
     def _encode_to_fit(
         self, img: PILImage, out_fmt: str, save_kw: dict[str, int]
     ) -> bytes:
         """Encode *img*, re-encoding as JPEG and/or downscaling if oversized.
 
-        Strategy: save as-is; if over limit, re-encode as JPEG (much smaller for
-        photos); then downscale by halves until under limit.  Keeps quality while
-        meeting OCR engine byte limits.
+        Strategy: save as-is (skipped when the raster obviously dwarfs the
+        budget); if over limit, re-encode as JPEG (much smaller for photos);
+        then one predicted downscale plus at most one corrective half-step
+        (see ``_downscale_to_fit``).  Keeps quality while meeting OCR engine
+        byte limits.
         """
-        data = self._encode(img, out_fmt, save_kw)
-        if self._fits(data):
-            return data
+        if out_fmt == "JPEG" or not self._obviously_oversized(img):
+            data = self._encode(img, out_fmt, save_kw)
+            if self._fits(data):
+                return data
         if out_fmt != "JPEG":
             img, out_fmt, save_kw, data = self._reencode_as_jpeg(img)
             if self._fits(data):
                 return data
         return self._downscale_to_fit(img, out_fmt, save_kw, data)
 
+    def _obviously_oversized(self, img: PILImage) -> bool:
+        """Whether *img*'s raw pixels dwarf the budget beyond any lossless win.
+
+        Lossless encoders rarely beat 4:1 on photographic rasters, so when
+        raw pixel bytes exceed four times the budget the first PNG/TIFF pass
+        cannot fit; skipping it saves a full deflate over the raster and goes
+        straight to the JPEG re-encode.
+        """
+        if self._max_bytes <= 0:
+            return False
+        return img.width * img.height * len(img.getbands()) > self._max_bytes * 4
+
     def _fits(self, data: bytes) -> bool:
         """Whether *data* is within the byte budget (a non-positive budget fits)."""
         return self._max_bytes <= 0 or len(data) <= self._max_bytes
@@ -109,17 +172,27 @@ class ImagePreparer:
     def _downscale_to_fit(
         self, img: PILImage, out_fmt: str, save_kw: dict[str, int], data: bytes
     ) -> bytes:
-        """Halve *img*'s dimensions up to five times until it fits the budget."""
-        from PIL import Image  # noqa: PLC0415
+        """Downscale *img* to a predicted size, plus one corrective half-step.
 
+        Encoded bytes scale roughly linearly with pixel count at fixed
+        quality, so the scale that fits the budget is ``sqrt(budget/size)``
+        (with 5% slack). One predicted resize replaces the old blind halving
+        loop's up-to-five full encodes; the half-step covers images where
+        the linear estimate misses.
+        """
         name = self._image_path.name
         current = img
-        for _ in range(5):
+        predicted = min(math.sqrt(self._max_bytes / len(data)) * 0.95, 0.95)
+        for scale in (predicted, 0.5):
             w, h = current.size
-            new_w, new_h = max(1, w // 2), max(1, h // 2)
+            new_w, new_h = max(1, int(w * scale)), max(1, int(h * scale))
             if (new_w, new_h) == (w, h):
                 break
-            current = current.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            # reducing_gap: box-reduce most of the way, LANCZOS only the rest —
+            # much cheaper than full-resolution LANCZOS at large shrink factors.
+            current = current.resize(
+                (new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=2.0
+            )
             data = self._encode(current, out_fmt, save_kw)
             logger.info(
                 "Downscaled %s to %dx%d (%d bytes)", name, new_w, new_h, len(data)
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, ClassVar, Protocol, cast, final
 from quarry.ingestion.ocr_availability import OcrAvailability, OcrUnavailableError
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
     from PIL import Image
 
 logger = logging.getLogger(__name__)
@@ -29,9 +31,13 @@ class OcrResult(Protocol):
 
 
 class OcrEngineProtocol(Protocol):
-    """Structural type for a callable RapidOCR engine."""
+    """Structural type for a callable RapidOCR engine.
 
-    def __call__(self, img: Image.Image) -> OcrResult: ...
+    RapidOCR accepts either a PIL image or an HxWx3 uint8 ndarray; the ndarray
+    form skips its internal PIL-to-array conversion.
+    """
+
+    def __call__(self, img: Image.Image | NDArray[np.uint8]) -> OcrResult: ...
 
 
 @final
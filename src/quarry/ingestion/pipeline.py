@@ -7,6 +7,7 @@ import time
 from collections.abc import Callable
 from dataclasses import replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -25,6 +26,7 @@ from quarry.ingest_collection import IngestCollection
 from quarry.ingestion.backends import get_ocr_backend
 from quarry.ingestion.image_prep import ImagePreparer
 from quarry.ingestion.ingest_stats import IngestStats
+from quarry.ingestion.rate_limiter import RateLimiter
 from quarry.ingestion.streaming import DocumentStreamer, progressive_insert
 from quarry.ingestion.text_format import TEXT_LIKE_FORMATS, TextLikeFormat
 from quarry.ingestion.web_fetch import WebFetcher
@@ -44,6 +46,20 @@ SUPPORTED_EXTENSIONS = (
 _NO_STATS = IngestStats()
 
 
+def _require_file(file_path: Path) -> None:
+    """Stat *file_path* once, raising FileNotFoundError with a clear message.
+
+    EAFP instead of ``exists()``: the same single stat syscall, but a
+    permission error propagates as itself rather than being swallowed into a
+    misleading "file not found".
+    """
+    try:
+        file_path.stat()
+    except FileNotFoundError as exc:
+        msg = f"File not found: {file_path}"
+        raise FileNotFoundError(msg) from exc
+
+
 def ingest_document(
     file_path: Path,
     database: Database,
@@ -82,59 +98,92 @@ def ingest_document(
         FileNotFoundError: If file does not exist.
         ValueError: If file format is not supported.
     """
-    if not file_path.exists():
-        msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
+    _require_file(file_path)
 
     suffix = file_path.suffix.lower()
+    handler = _HANDLERS.get(suffix)
+    if handler is None:
+        msg = f"Unsupported file format: {suffix}"
+        raise ValueError(msg)
+    return handler(
+        file_path,
+        database,
+        settings,
+        overwrite=overwrite,
+        collection=collection,
+        document_name=document_name,
+        progress_callback=progress_callback,
+        agent_handle=agent_handle,
+        memory_type=memory_type,
+        summary=summary,
+    )
 
-    # Common kwargs for agent memory tagging, forwarded to all handlers.
-    memory_kw = {
-        "agent_handle": agent_handle,
-        "memory_type": memory_type,
-        "summary": summary,
-    }
 
-    if suffix == ".pdf":
-        return ingest_pdf(
-            file_path,
-            database,
-            settings,
-            overwrite=overwrite,
-            collection=collection,
-            document_name=document_name,
-            progress_callback=progress_callback,
-            **memory_kw,
-        )
+def ingest_documents(
+    file_paths: list[Path],
+    database: Database,
+    settings: Settings,
+    *,
+    overwrite: bool = False,
+    collection: str = "default",
+    max_workers: int = 4,
+    progress_callback: Callable[[str], None] | None = None,
+    agent_handle: str = "",
+    memory_type: str = "",
+    summary: str = "",
+) -> tuple[list[IngestResult], list[str]]:
+    """Ingest several independent documents concurrently.
 
-    if suffix in SUPPORTED_IMAGE_EXTENSIONS:
-        return ingest_image(
-            file_path,
-            database,
-            settings,
-            overwrite=overwrite,
-            collection=collection,
-            document_name=document_name,
-            progress_callback=progress_callback,
-            **memory_kw,
-        )
+    Fans :func:`ingest_document` out over a thread pool, mirroring the bulk
+    URL path: the heavy stages (fitz parsing, OCR inference, embedding) all
+    release the GIL, the model and OCR backends are process-wide singletons,
+    and the chunk store serializes LanceDB writes — so threads scale here
+    where a process pool would cold-load the models per worker. One failing
+    file is reported, not fatal.
 
-    fmt = TEXT_LIKE_FORMATS.get(suffix)
-    if fmt is not None:
-        return _ingest_text_like(
-            fmt,
-            file_path,
-            database,
-            settings,
-            overwrite=overwrite,
-            collection=collection,
-            document_name=document_name,
-            progress_callback=progress_callback,
-            **memory_kw,
-        )
+    Returns:
+        ``(results, errors)`` — one :class:`IngestResult` per ingested file
+        and one ``"path: reason"`` string per failure.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed  # noqa: PLC0415
 
-    msg = f"Unsupported file format: {suffix}"
-    raise ValueError(msg)
+    progress = _make_progress(progress_callback)
+    results: list[IngestResult] = []
+    errors: list[str] = []
+    if not file_paths:
+        return results, errors
+
+    workers = max(1, min(max_workers, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                ingest_document,
+                file_path,
+                database,
+                settings,
+                overwrite=overwrite,
+                collection=collection,
+                agent_handle=agent_handle,
+                memory_type=memory_type,
+                summary=summary,
+            ): file_path
+            for file_path in file_paths
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                results.append(future.result())
+                progress(
+                    "Ingested %s (%d/%d)",
+                    file_path.name,
+                    len(results),
+                    len(file_paths),
+                )
+            except Exception as exc:
+                errors.append(f"{file_path}: {exc}")
+                logger.exception("Failed to ingest %s", file_path)
+                progress("Failed %s: %s", file_path, exc)
+    return results, errors
 
 
 def ingest_pdf(
@@ -329,6 +378,24 @@ def ingest_image(
     )
 
 
+def _build_handlers() -> dict[str, Callable[..., IngestResult]]:
+    """Map each supported suffix to its format handler, built once at import.
+
+    All handlers share the :func:`ingest_document` keyword surface; the
+    text-like formats bind their :class:`TextLikeFormat` via ``partial`` so
+    the dispatch table stays a flat suffix -> callable lookup.
+    """
+    handlers: dict[str, Callable[..., IngestResult]] = {".pdf": ingest_pdf}
+    for ext in SUPPORTED_IMAGE_EXTENSIONS:
+        handlers[ext] = ingest_image
+    for ext, fmt in TEXT_LIKE_FORMATS.items():
+        handlers[ext] = partial(_ingest_text_like, fmt)
+    return handlers
+
+
+_HANDLERS = _build_handlers()
+
+
 def _ingest_multipage_image(
     file_path: Path,
     page_count: int,
@@ -473,6 +540,7 @@ def ingest_url(
     document_name: str | None = None,
     timeout: int = 30,
     delay: float = 0.0,
+    rate_limiter: RateLimiter | None = None,
     progress_callback: Callable[[str], None] | None = None,
     content_scrubber: Callable[[str], str] | None = None,
     agent_handle: str = "",
@@ -491,6 +559,9 @@ def ingest_url(
         timeout: HTTP request timeout in seconds.
         delay: Pre-fetch sleep in seconds plus 0-1s sub-second jitter, to avoid
             synchronized bursts when many workers fetch in parallel. 0 disables.
+        rate_limiter: Shared site-wide limiter; when set it replaces the
+            per-call ``delay`` sleep, so parallel workers collectively fetch
+            at the polite rate instead of each paying the delay per URL.
         progress_callback: Optional callable for progress messages.
         content_scrubber: Optional redaction hook applied to each extracted page
             before chunking. ``None`` (the default) stores the fetched text
@@ -523,7 +594,9 @@ def ingest_url(
         document_name = content_scrubber(document_name)
         summary = content_scrubber(summary)
 
-    if delay:
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    elif delay:
         # Sub-second jitter from the monotonic clock (non-security-critical) to
         # desync parallel fetchers without importing random.
         jitter = time.monotonic_ns() % 1_000_000_000 / 1_000_000_000
@@ -621,11 +694,11 @@ def _bulk_ingest_entries(
     after_filter = len(filtered)
     progress("Selected %d safe URLs to ingest", after_filter)
 
-    # Build lookup of existing documents for lastmod dedup
-    existing_docs = database.catalog.list_documents(collection_filter=collection)
-    existing_timestamps: dict[str, str] = {
-        doc["document_name"]: doc["ingestion_timestamp"] for doc in existing_docs
-    }
+    # Build lookup of existing documents for lastmod dedup (two-column
+    # projection; the full list_documents summary is not needed here)
+    existing_timestamps = database.catalog.document_timestamps(
+        collection_filter=collection
+    )
 
     # Determine which URLs to ingest vs skip
     to_ingest: list[tuple[str, str | None]] = []
@@ -650,6 +723,10 @@ def _bulk_ingest_entries(
     errors: list[str] = []
 
     if to_ingest:
+        # One limiter shared by all workers: the crawl fetches at the polite
+        # site-wide rate (one fetch per `delay` seconds) instead of every
+        # worker sleeping the full delay before each URL.
+        limiter = RateLimiter(delay)
         with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
                 executor.submit(
@@ -663,7 +740,7 @@ def _bulk_ingest_entries(
                     collection=collection,
                     document_name=doc_name,
                     timeout=timeout,
-                    delay=delay,
+                    rate_limiter=limiter,
                     agent_handle=agent_handle,
                     memory_type=memory_type,
                     summary=summary,
@@ -740,8 +817,9 @@ def ingest_sitemap(
         limit: Max URLs to ingest (0 = no limit).
         overwrite: Force re-ingest regardless of <lastmod>.
         workers: Parallel fetch workers (minimum 1).
-        delay: Base delay in seconds between fetches per worker
-            (adds 0-1.0s sub-second jitter). Default 0.5s.
+        delay: Minimum spacing in seconds between fetches site-wide: all
+            workers share one rate limiter, so one URL is fetched per
+            ``delay`` seconds regardless of worker count. Default 0.5s.
         timeout: HTTP timeout in seconds.
         progress_callback: Optional callable for progress messages.
 
@@ -777,6 +855,19 @@ def ingest_sitemap(
     )
 
 
+def _url_is_sitemap(path: str) -> bool:
+    """Whether the URL path names a sitemap file, in one pass over the tail.
+
+    Matches sitemap files (*.xml, *.xml.gz, *.txt) and bare /sitemap paths,
+    but not pages that merely contain "sitemap" as a substring
+    (e.g. /sitemap-guide).
+    """
+    last_segment = path.rsplit("/", 1)[-1].lower()
+    return last_segment.startswith("sitemap") and (
+        last_segment.endswith((".xml", ".xml.gz", ".txt")) or last_segment == "sitemap"
+    )
+
+
 def ingest_auto(
     url: str,
     database: Database,
@@ -810,7 +901,8 @@ def ingest_auto(
         overwrite: Force re-ingest regardless of existing data.
         collection: Collection name. Defaults to the URL hostname.
         workers: Parallel fetch workers for sitemap crawl (default 4).
-        delay: Base delay between fetches in seconds (default 0.5).
+        delay: Minimum spacing in seconds between sitemap fetches,
+            shared site-wide across workers (default 0.5).
         timeout: HTTP timeout in seconds.
         progress_callback: Optional callable for progress messages.
 
@@ -827,14 +919,7 @@ def ingest_auto(
     collection = IngestCollection.resolve(url, collection).name
 
     # If the URL itself is a sitemap, skip discovery and crawl directly.
-    # Match sitemap files (*.xml, *.xml.gz) and /sitemap paths, but not
-    # pages that merely contain "sitemap" as a substring (e.g. /sitemap-guide).
-    path_lower = parsed.path.lower()
-    last_segment = path_lower.rsplit("/", 1)[-1]
-    is_sitemap = last_segment.startswith("sitemap") and (
-        last_segment.endswith((".xml", ".xml.gz", ".txt")) or last_segment == "sitemap"
-    )
-    if is_sitemap:
+    if _url_is_sitemap(parsed.path):
         progress("URL is a sitemap, crawling directly")
         return ingest_sitemap(
             url,
@@ -883,8 +968,6 @@ def ingest_auto(
 
     # Apply include filter once up front to avoid double-filtering
     # inside _bulk_ingest_entries.
-    from quarry.sitemap import SitemapDiscovery  # noqa: PLC0415
-
     if include:
         entries = SitemapDiscovery.filter_entries(entries, include=include)
 
@@ -926,12 +1009,22 @@ def ingest_auto(
 def _make_progress(
     callback: Callable[[str], None] | None,
 ) -> Callable[..., None]:
-    """Create a progress reporter that logs and optionally calls a callback."""
+    """Create a progress reporter that logs and optionally calls a callback.
+
+    Without a callback — the common case for daemon and bulk ingest —
+    ``logger.info`` itself is the reporter: no wrapper frame per event and
+    no eager ``%`` formatting, since logging formats lazily only when INFO
+    is enabled.
+    """
+    if callback is None:
+        return logger.info
 
     def _progress(fmt: str, *args: object) -> None:
-        logger.info(fmt, *args)
-        if callback is not None:
-            callback(fmt % args if args else fmt)
+        # Format once and hand the same string to both sinks; logging would
+        # otherwise repeat the % interpolation the callback already paid for.
+        msg = fmt % args if args else fmt
+        logger.info("%s", msg)
+        callback(msg)
 
     return _progress
 
@@ -1032,9 +1125,7 @@ def plan_file_chunks(
         FileNotFoundError: If *file_path* does not exist.
         ValueError: If the file format is not supported.
     """
-    if not file_path.exists():
-        msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
+    _require_file(file_path)
     document_name = document_name or file_path.name
     suffix = file_path.suffix.lower()
     pages = _extract_pages(file_path, suffix, document_name, settings)
@@ -0,0 +1,42 @@
+"""Site-wide politeness rate limiting for parallel URL fetches."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Self, final
+
+
+@final
+class RateLimiter:
+    """Space acquisitions at least *interval* seconds apart across threads.
+
+    A shared next-slot timestamp under a lock: each acquirer claims the next
+    free slot and sleeps only until its own slot arrives, so N workers fetch
+    at the polite site-wide rate instead of each paying the full delay per
+    URL. An ``interval`` of 0 disables limiting entirely.
+    """
+
+    __slots__ = ("_interval", "_lock", "_next_slot")
+
+    _interval: float
+    _lock: threading.Lock
+    _next_slot: float
+
+    def __new__(cls, interval: float) -> Self:
+        self = super().__new__(cls)
+        self._interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+        return self
+
+    def acquire(self) -> None:
+        """Block until this caller's slot arrives, then claim the next one."""
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            time.sleep(wait)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from typing import TYPE_CHECKING, Self
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from quarry.db.chunk_store import ChunkStore
     from quarry.ingestion.progressive import FlushCheckpoint
     from quarry.models import Chunk, PageContent
+    from quarry.types import EmbeddingBackend
 
 
 class DocumentStreamer:
@@ -80,8 +82,26 @@ class DocumentStreamer:
         tail = chunks[start_index:]
         for offset in range(0, len(tail), window):
             batch = tail[offset : offset + window]
-            vectors: NDArray[np.float32] = embedder.embed_texts([c.text for c in batch])
-            yield batch, vectors
+            yield batch, self._embed_window(embedder, batch)
+
+    @staticmethod
+    def _embed_window(
+        embedder: EmbeddingBackend, batch: list[Chunk]
+    ) -> NDArray[np.float32]:
+        """Embed one window's texts, running inference once per distinct text.
+
+        Repeated boilerplate (headers, footers, license blocks) chunks to
+        identical texts; an embedding is a pure function of its text, so
+        duplicates within a window reuse the first occurrence's vector.
+        """
+        texts = [chunk.text for chunk in batch]
+        distinct: dict[str, int] = {}
+        for text in texts:
+            distinct.setdefault(text, len(distinct))
+        vectors: NDArray[np.float32] = embedder.embed_texts(list(distinct))
+        if len(distinct) == len(texts):
+            return vectors
+        return vectors[[distinct[text] for text in texts]]
 
 
 class _PlainFlushTarget:
@@ -116,16 +136,27 @@ def progressive_insert(
 ) -> int:
     """Embed *chunks* in windows and progressively insert via ProgressiveIndexer.
 
-    Bounds peak resident vectors to ``sync_flush_mb + one window`` and makes each
-    flushed window searchable, even for a single very large document.
+    Window N+1 embeds on a single worker thread while window N is buffered and
+    flushed on the calling thread (ONNX inference releases the GIL), so embed
+    and insert overlap instead of alternating. Peak resident vectors are
+    ``sync_flush_mb + two windows`` — the in-flight window plus the prefetched
+    one — and each flushed window is searchable, even for a single very large
+    document.
     """
     target = _PlainFlushTarget(store)
     indexer = ProgressiveIndexer(
         target, flush_bytes=settings.sync_flush_mb * 1024 * 1024
     )
     indexer.begin_file(document_name, total_chunks=len(chunks))
-    for batch, vectors in DocumentStreamer(settings).stream_batches(chunks):
-        indexer.add_window(document_name, batch, vectors)
+    windows = DocumentStreamer(settings).stream_batches(chunks)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed-prefetch") as pool:
+        # One-slot pipeline: only the worker advances the generator, so the
+        # embedding calls stay sequential while inserts run concurrently.
+        future = pool.submit(next, windows, None)
+        while (item := future.result()) is not None:
+            future = pool.submit(next, windows, None)
+            batch, vectors = item
+            indexer.add_window(document_name, batch, vectors)
     indexer.complete_file(document_name)
     indexer.drain()
     return indexer.inserted_count
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import io
+import time
 from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, patch
 
 import fitz
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -83,23 +85,88 @@ class TestExtractText:
         assert LocalOcrBackend._extract_text(result) == "Only line"
 
 
+class TestPrefetched:
+    def test_preserves_order_and_exhausts(self) -> None:
+        pages = iter([(1, "a"), (2, "b"), (3, "c")])
+        assert list(LocalOcrBackend._prefetched(pages)) == [
+            (1, "a"),
+            (2, "b"),
+            (3, "c"),
+        ]
+
+    def test_empty_iterator(self) -> None:
+        assert list(LocalOcrBackend._prefetched(iter([]))) == []
+
+    def test_source_exception_propagates(self) -> None:
+        def pages():
+            yield 1, "a"
+            raise ValueError("decode failed")
+
+        with pytest.raises(ValueError, match="decode failed"):
+            list(LocalOcrBackend._prefetched(pages()))
+
+    def test_close_stops_the_worker(self) -> None:
+        # When the consumer unwinds early (an engine failure in _ocr_pages),
+        # close() must join the worker's in-flight fetch before returning so
+        # the source is never advanced after the caller released its
+        # resources (e.g. the fitz document behind a PDF render).
+        advanced: list[int] = []
+
+        def pages():
+            for num in range(1, 4):
+                advanced.append(num)
+                yield num, "img"
+
+        prefetched = LocalOcrBackend._prefetched(pages())
+        assert next(prefetched) == (1, "img")
+        prefetched.close()
+        seen = list(advanced)
+        time.sleep(0.05)
+        assert advanced == seen
+
+
 class TestRenderPdfPage:
-    def test_renders_to_pil_image(self, tmp_path: Path) -> None:
+    def test_renders_to_rgb_ndarray(self, tmp_path: Path) -> None:
         pdf_path = _create_pdf(tmp_path, "test")
         with fitz.open(pdf_path) as doc:
             img = LocalOcrBackend._render_pdf_page(doc, 1)
-        assert isinstance(img, Image.Image)
-        assert img.mode == "RGB"
-        assert img.width > 0
-        assert img.height > 0
+        assert isinstance(img, np.ndarray)
+        assert img.dtype == np.uint8
+        assert img.ndim == 3
+        assert img.shape[2] == 3  # RGB channels
+        assert img.shape[0] > 0
+        assert img.shape[1] > 0
+
+    def test_array_outlives_the_pixmap(self, tmp_path: Path) -> None:
+        # The view must keep the pixmap's sample buffer alive after the
+        # render call returns — a dangling buffer would be garbage pixels.
+        pdf_path = _create_pdf(tmp_path, "test")
+        with fitz.open(pdf_path) as doc:
+            img = LocalOcrBackend._render_pdf_page(doc, 1)
+            assert img.max() > 0  # white page renders as 255s
+
+    def test_letter_page_renders_below_200_dpi(self) -> None:
+        # 8.5"x11" = 612x792 pt → ~116 DPI lands the long edge near 1280 px.
+        dpi = LocalOcrBackend._page_ocr_dpi(fitz.Rect(0, 0, 612, 792))
+        assert 100 <= dpi < 200
+        assert abs(792 / 72 * dpi - 1280) < 792 / 72  # within one inch-row of target
+
+    def test_small_page_caps_at_max_dpi(self) -> None:
+        assert LocalOcrBackend._page_ocr_dpi(fitz.Rect(0, 0, 72, 72)) == 200
+
+    def test_poster_page_floors_at_min_dpi(self) -> None:
+        assert LocalOcrBackend._page_ocr_dpi(fitz.Rect(0, 0, 7200, 7200)) == 72
+
+    def test_degenerate_rect_uses_max_dpi(self) -> None:
+        assert LocalOcrBackend._page_ocr_dpi(fitz.Rect(0, 0, 0, 0)) == 200
 
     def test_page_number_is_one_indexed(self, tmp_path: Path) -> None:
         pdf_path = _create_pdf(tmp_path, "test", num_pages=3)
         with fitz.open(pdf_path) as doc:
             img1 = LocalOcrBackend._render_pdf_page(doc, 1)
             img3 = LocalOcrBackend._render_pdf_page(doc, 3)
-        assert isinstance(img1, Image.Image)
-        assert isinstance(img3, Image.Image)
+        assert isinstance(img1, np.ndarray)
+        assert isinstance(img3, np.ndarray)
 
 
 class TestLocalOcrBackendPdf:
@@ -198,6 +265,35 @@ class TestLocalOcrBackendTiff:
         assert len(results) == 1
         assert results[0].document_name == "scan.tif"
 
+    def test_out_of_order_request_returns_ascending_pages(self, tmp_path: Path) -> None:
+        tiff_path = _create_tiff(tmp_path, num_frames=3)
+        mock_engine = MagicMock(
+            side_effect=[
+                _mock_ocr_result(["frame 1"]),
+                _mock_ocr_result(["frame 3"]),
+            ]
+        )
+
+        with patch.object(OcrEngine, "get", return_value=mock_engine):
+            backend = LocalOcrBackend(_settings())
+            results = backend.ocr_document(
+                tiff_path, [3, 1], 3, document_name="scan.tiff"
+            )
+
+        assert [r.page_number for r in results] == [1, 3]
+
+    def test_grayscale_frames_convert_to_rgb(self, tmp_path: Path) -> None:
+        tiff_path = tmp_path / "gray.tiff"
+        Image.new("L", (100, 100), color=128).save(tiff_path)
+        mock_engine = MagicMock(return_value=_mock_ocr_result(["text"]))
+
+        with patch.object(OcrEngine, "get", return_value=mock_engine):
+            backend = LocalOcrBackend(_settings())
+            backend.ocr_document(tiff_path, [1], 1, document_name="gray.tiff")
+
+        frame = mock_engine.call_args[0][0]
+        assert frame.mode == "RGB"
+
     def test_handles_no_text_detected(self, tmp_path: Path) -> None:
         tiff_path = _create_tiff(tmp_path, num_frames=1)
         mock_engine = MagicMock(return_value=_mock_ocr_result(None))
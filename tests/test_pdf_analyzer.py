@@ -10,12 +10,13 @@ from quarry.extractors.pdf_extractor import MIN_TEXT_CHARS_FOR_TEXT_PAGE, PdfExt
 from quarry.ingestion.ocr_availability import OcrUnavailableError
 from quarry.ingestion.ocr_engine import OcrEngine
 from quarry.ingestion.ocr_local import LocalOcrBackend
-from quarry.models import PageType
+from quarry.models import PageContent, PageType
 
 
 def _mock_page(text: str) -> MagicMock:
+    """Mock a fitz page whose ``get_text("blocks")`` yields one text block."""
     page = MagicMock()
-    page.get_text.return_value = text
+    page.get_text.return_value = [(0.0, 0.0, 1.0, 1.0, text, 0, 0)]
     return page
 
 
@@ -106,6 +107,84 @@ class TestClassifyPages:
         assert results[1].page_number == 2
 
 
+class TestClassifyPagesParallel:
+    def test_large_pdf_keeps_page_order_and_types(self, tmp_path):
+        pdf_path = tmp_path / "big.pdf"
+        pdf_path.touch()
+
+        # 70 pages (above the parallel threshold), TEXT on even indices.
+        pages = [
+            _mock_page("x" * 100 if idx % 2 == 0 else "short") for idx in range(70)
+        ]
+
+        def _doc(_path) -> MagicMock:
+            # Each worker opens its own handle; give every open a fresh mock.
+            doc = MagicMock()
+            doc.__len__ = lambda _: 70
+            doc.__getitem__ = lambda _, idx: pages[idx]
+            return _mock_doc_cm(doc)
+
+        with patch("quarry.extractors.pdf_extractor.fitz.open", side_effect=_doc):
+            results = PdfExtractor._classify_pages(pdf_path)
+
+        assert [r.page_number for r in results] == list(range(1, 71))
+        for idx, result in enumerate(results):
+            expected = PageType.TEXT if idx % 2 == 0 else PageType.IMAGE
+            assert result.page_type == expected
+
+
+class TestPageTextLength:
+    def test_image_blocks_do_not_count(self):
+        page = MagicMock()
+        page.get_text.return_value = [
+            (0.0, 0.0, 1.0, 1.0, "<image: DeviceRGB>", 0, 1),
+            (0.0, 1.0, 1.0, 2.0, "caption", 1, 0),
+        ]
+        assert PdfExtractor._page_text_length(page, 50) == len("caption")
+
+    def test_count_saturates_at_the_threshold_block(self):
+        # Early exit: once the running count clears the threshold, later
+        # blocks are never visited, so the count stops mid-page.
+        page = MagicMock()
+        page.get_text.return_value = [
+            (0.0, 0.0, 1.0, 1.0, "x" * 60, 0, 0),
+            (0.0, 1.0, 1.0, 2.0, "y" * 1000, 1, 0),
+        ]
+        assert PdfExtractor._page_text_length(page, 50) == 60
+
+
+class TestExtractPagesMixed:
+    """Both phases of a mixed PDF land, merged in page order."""
+
+    def test_text_and_ocr_pages_merge_sorted(self, tmp_path: Path) -> None:
+        pdf_path = tmp_path / "mixed.pdf"
+        doc = fitz.open()
+        doc.new_page()  # blank → IMAGE → OCR
+        text_page = doc.new_page()
+        text_page.insert_text((72, 72), "This page has a real text layer. " * 4)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        ocr = MagicMock()
+        ocr.ocr_document.return_value = [
+            PageContent(
+                document_name="mixed.pdf",
+                document_path=str(pdf_path),
+                page_number=1,
+                total_pages=2,
+                text="scanned text",
+                page_type=PageType.IMAGE,
+            )
+        ]
+        extractor = PdfExtractor(Settings.model_validate({}), ocr)
+        pages = extractor.extract_pages(pdf_path, document_name="mixed.pdf")
+
+        assert [p.page_number for p in pages] == [1, 2]
+        assert pages[0].text == "scanned text"
+        assert "real text layer" in pages[1].text
+        ocr.ocr_document.assert_called_once()
+
+
 class TestExtractPagesDegradesWithoutOcr:
     """A mixed PDF on a headless box indexes its text page, skips its scan page."""
 
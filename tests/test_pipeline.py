@@ -487,6 +487,68 @@ class TestIngestDocument:
             ingest_document(zip_file, db, _settings())
 
 
+class TestIngestDocuments:
+    def test_fans_out_and_collects_results(self, monkeypatch, tmp_path: Path):
+        from quarry.ingestion.pipeline import ingest_documents
+
+        paths = [tmp_path / "a.md", tmp_path / "b.md", tmp_path / "c.md"]
+        for path in paths:
+            path.write_text("content")
+
+        def _fake_ingest(file_path, _db, _settings, **_kw):
+            return {
+                "document_name": file_path.name,
+                "collection": "default",
+                "chunks": 1,
+            }
+
+        monkeypatch.setattr(
+            "quarry.ingestion.pipeline.ingest_document", _fake_ingest
+        )
+
+        db = Database(MagicMock())
+        results, errors = ingest_documents(paths, db, _settings())
+
+        assert errors == []
+        assert sorted(r["document_name"] for r in results) == ["a.md", "b.md", "c.md"]
+
+    def test_one_failure_is_reported_not_fatal(self, monkeypatch, tmp_path: Path):
+        from quarry.ingestion.pipeline import ingest_documents
+
+        good = tmp_path / "good.md"
+        bad = tmp_path / "bad.md"
+        good.write_text("content")
+        bad.write_text("content")
+
+        def _fake_ingest(file_path, _db, _settings, **_kw):
+            if file_path.name == "bad.md":
+                msg = "parse exploded"
+                raise ValueError(msg)
+            return {
+                "document_name": file_path.name,
+                "collection": "default",
+                "chunks": 1,
+            }
+
+        monkeypatch.setattr(
+            "quarry.ingestion.pipeline.ingest_document", _fake_ingest
+        )
+
+        db = Database(MagicMock())
+        results, errors = ingest_documents([good, bad], db, _settings())
+
+        assert [r["document_name"] for r in results] == ["good.md"]
+        assert len(errors) == 1
+        assert "bad.md" in errors[0]
+        assert "parse exploded" in errors[0]
+
+    def test_empty_list_is_a_no_op(self):
+        from quarry.ingestion.pipeline import ingest_documents
+
+        db = Database(MagicMock())
+        assert ingest_documents([], db, _settings()) == ([], [])
+
+
 class TestIngestText:
     def test_ingests_raw_text(self, monkeypatch):
         chunks = [
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -425,6 +426,154 @@ class TestPrepareImageBytes:
         assert result[:2] == b"\xff\xd8"  # Still JPEG
         assert len(result) <= jpeg_size // 4
 
+    def test_downscale_fits_within_two_resize_encodes(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """The sqrt size estimator needs at most two encodes after the first."""
+        path = tmp_path / "big.jpg"
+        yy, xx = np.indices((3000, 4000))
+        pixels = np.stack([xx % 256, yy % 256, (xx + yy) % 256], axis=-1).astype(
+            np.uint8
+        )
+        Image.fromarray(pixels, mode="RGB").save(path, format="JPEG", quality=99)
+        jpeg_size = path.stat().st_size
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        encodes: list[int] = []
+        original = ImagePreparer._encode
+
+        def counting(img: Image.Image, fmt: str, kw: dict[str, int]) -> bytes:
+            data = original(img, fmt, kw)
+            encodes.append(len(data))
+            return data
+
+        monkeypatch.setattr(ImagePreparer, "_encode", staticmethod(counting))
+        result = ImagePreparer(
+            path, needs_conversion=False, max_bytes=jpeg_size // 4
+        ).to_bytes()
+
+        assert len(result) <= jpeg_size // 4
+        # Initial probe encode + predicted resize (+ at most one half-step);
+        # the old halving loop could take up to six.
+        assert len(encodes) <= 3
+
+    def test_heavily_oversized_jpeg_drafts_before_decode(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """A JPEG far over budget engages the DCT-domain draft pre-shrink."""
+        path = tmp_path / "big.jpg"
+        yy, xx = np.indices((3000, 4000))
+        pixels = np.stack([xx % 256, yy % 256, (xx + yy) % 256], axis=-1).astype(
+            np.uint8
+        )
+        Image.fromarray(pixels, mode="RGB").save(path, format="JPEG", quality=99)
+        jpeg_size = path.stat().st_size
+
+        from PIL.JpegImagePlugin import JpegImageFile
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        drafted: list[tuple[int, int]] = []
+        original_draft = JpegImageFile.draft
+
+        def spy(self: JpegImageFile, mode: str | None, size: tuple[int, int]):
+            drafted.append(size)
+            return original_draft(self, mode, size)
+
+        monkeypatch.setattr(JpegImageFile, "draft", spy)
+        result = ImagePreparer(
+            path, needs_conversion=False, max_bytes=jpeg_size // 8
+        ).to_bytes()
+
+        assert drafted, "draft() should pre-shrink decode for 8x-over-budget JPEG"
+        assert len(result) <= jpeg_size // 8
+
+    def test_obviously_oversized_png_skips_lossless_encode(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """Raw pixels far over budget skip the doomed first PNG encode."""
+        path = tmp_path / "big.png"
+        rng = np.random.default_rng(42)
+        pixels = rng.integers(0, 256, (500, 500, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(path, format="PNG")
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        formats: list[str] = []
+        original = ImagePreparer._encode
+
+        def recording(img: Image.Image, fmt: str, kw: dict[str, int]) -> bytes:
+            formats.append(fmt)
+            return original(img, fmt, kw)
+
+        monkeypatch.setattr(ImagePreparer, "_encode", staticmethod(recording))
+        # 500*500*3 raw bytes against a 10 KB budget: > 4x, so the PNG pass
+        # cannot fit and must not run.
+        result = ImagePreparer(
+            path, needs_conversion=False, max_bytes=10_000
+        ).to_bytes()
+
+        assert "PNG" not in formats
+        assert result[:2] == b"\xff\xd8"
+
+    def test_upright_image_skips_exif_transpose(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """No orientation tag (or orientation 1) never pays the transpose copy."""
+        path = tmp_path / "upright.jpg"
+        Image.new("RGB", (40, 30), color=(120, 60, 30)).save(path, format="JPEG")
+
+        from PIL import ImageOps
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        calls: list[object] = []
+        monkeypatch.setattr(
+            ImageOps, "exif_transpose", lambda im: calls.append(im) or im
+        )
+        ImagePreparer(path, needs_conversion=True, max_bytes=0).to_bytes()
+
+        assert calls == []
+
+    def test_rotated_orientation_still_transposes(self, tmp_path: Path) -> None:
+        """Orientation 6 (90-degree rotation) swaps the output dimensions."""
+        path = tmp_path / "rotated.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        Image.new("RGB", (40, 30), color=(120, 60, 30)).save(
+            path, format="JPEG", exif=exif
+        )
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        result = ImagePreparer(path, needs_conversion=True, max_bytes=0).to_bytes()
+
+        with Image.open(io.BytesIO(result)) as out:
+            assert out.size == (30, 40)
+
+    def test_bmp_conversion_uses_fast_png_encode(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """BMP -> PNG conversion passes compress_level=1 (OCR-only bytes)."""
+        path = tmp_path / "scan.bmp"
+        Image.new("RGB", (40, 30), color=(200, 200, 200)).save(path, format="BMP")
+
+        from quarry.ingestion.image_prep import ImagePreparer
+
+        saves: list[tuple[str, dict[str, int]]] = []
+        original = ImagePreparer._encode
+
+        def recording(img: Image.Image, fmt: str, kw: dict[str, int]) -> bytes:
+            saves.append((fmt, kw))
+            return original(img, fmt, kw)
+
+        monkeypatch.setattr(ImagePreparer, "_encode", staticmethod(recording))
+        result = ImagePreparer(path, needs_conversion=True, max_bytes=0).to_bytes()
+
+        assert result[:8] == b"\x89PNG\r\n\x1a\n"
+        assert saves[0] == ("PNG", {"compress_level": 1})
+
     def test_conversion_still_works_with_max_bytes(self, tmp_path: Path) -> None:
         """BMP conversion produces PNG when result fits max_bytes."""
         path = tmp_path / "scan.bmp"
@@ -0,0 +1,41 @@
+"""Tests for the shared politeness RateLimiter."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from quarry.ingestion.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    def test_zero_interval_never_blocks(self) -> None:
+        limiter = RateLimiter(0.0)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_negative_interval_treated_as_disabled(self) -> None:
+        limiter = RateLimiter(-1.0)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_sequential_acquisitions_are_spaced(self) -> None:
+        limiter = RateLimiter(0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        # First slot is immediate; the next two wait one interval each.
+        assert time.monotonic() - start >= 0.1
+
+    def test_concurrent_acquisitions_share_the_rate(self) -> None:
+        limiter = RateLimiter(0.05)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: limiter.acquire(), range(4)))
+        elapsed = time.monotonic() - start
+        # Four slots spaced 50 ms apart: at least 150 ms total, but far less
+        # than the 200 ms four independent per-worker sleeps would cost.
+        assert elapsed >= 0.15
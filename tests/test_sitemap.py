@@ -245,12 +245,12 @@ class TestIngestSitemapDedup:
     """Test lastmod-based deduplication in ingest_sitemap."""
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_skips_when_lastmod_older(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -261,12 +261,9 @@ class TestIngestSitemapDedup:
                 lastmod=datetime(2025, 1, 1, tzinfo=UTC),
             ),
         ]
-        mock_list_docs.return_value = [
-            {
-                "document_name": "https://example.com/page1",
-                "ingestion_timestamp": "2025-06-01T00:00:00+00:00",
-            }
-        ]
+        mock_timestamps.return_value = {
+            "https://example.com/page1": "2025-06-01T00:00:00+00:00",
+        }
 
         result = ingest_sitemap(
             "https://example.com/sitemap.xml",
@@ -280,12 +277,12 @@ class TestIngestSitemapDedup:
         mock_ingest.assert_not_called()
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_ingests_when_lastmod_newer(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -296,12 +293,9 @@ class TestIngestSitemapDedup:
                 lastmod=datetime(2025, 12, 1, tzinfo=UTC),
             ),
         ]
-        mock_list_docs.return_value = [
-            {
-                "document_name": "https://example.com/page1",
-                "ingestion_timestamp": "2025-01-01T00:00:00+00:00",
-            }
-        ]
+        mock_timestamps.return_value = {
+            "https://example.com/page1": "2025-01-01T00:00:00+00:00",
+        }
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -315,12 +309,12 @@ class TestIngestSitemapDedup:
         assert result["ingested"] == 1
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_ingests_when_no_existing_doc(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -331,7 +325,7 @@ class TestIngestSitemapDedup:
                 lastmod=datetime(2025, 1, 1, tzinfo=UTC),
             ),
         ]
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -345,12 +339,12 @@ class TestIngestSitemapDedup:
         assert result["skipped"] == 0
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_overwrite_bypasses_dedup(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -361,12 +355,9 @@ class TestIngestSitemapDedup:
                 lastmod=datetime(2025, 1, 1, tzinfo=UTC),
             ),
         ]
-        mock_list_docs.return_value = [
-            {
-                "document_name": "https://example.com/page1",
-                "ingestion_timestamp": "2025-06-01T00:00:00+00:00",
-            }
-        ]
+        mock_timestamps.return_value = {
+            "https://example.com/page1": "2025-06-01T00:00:00+00:00",
+        }
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -381,12 +372,12 @@ class TestIngestSitemapDedup:
         assert result["skipped"] == 0
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_no_lastmod_always_ingests(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -394,12 +385,9 @@ class TestIngestSitemapDedup:
         mock_discover.return_value = [
             SitemapEntry(loc="https://example.com/page1", lastmod=None),
         ]
-        mock_list_docs.return_value = [
-            {
-                "document_name": "https://example.com/page1",
-                "ingestion_timestamp": "2025-06-01T00:00:00+00:00",
-            }
-        ]
+        mock_timestamps.return_value = {
+            "https://example.com/page1": "2025-06-01T00:00:00+00:00",
+        }
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -455,7 +443,8 @@ class TestIngestSitemapIntegration:
         with (
             patch("quarry.db.chunk_store.ChunkStore.insert_records", return_value=1),
             patch(
-                "quarry.db.chunk_catalog.ChunkCatalog.list_documents", return_value=[]
+                "quarry.db.chunk_catalog.ChunkCatalog.document_timestamps",
+                return_value={},
             ),
         ):
             result = ingest_sitemap(
@@ -502,7 +491,8 @@ class TestIngestSitemapIntegration:
         with (
             patch("quarry.db.chunk_store.ChunkStore.insert_records", return_value=1),
             patch(
-                "quarry.db.chunk_catalog.ChunkCatalog.list_documents", return_value=[]
+                "quarry.db.chunk_catalog.ChunkCatalog.document_timestamps",
+                return_value={},
             ),
         ):
             result = ingest_sitemap(
@@ -518,18 +508,18 @@ class TestIngestSitemapIntegration:
         assert result["ingested"] == 2
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_default_collection_from_domain(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         _mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
 
         mock_discover.return_value = []
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
 
         result = ingest_sitemap(
             "https://docs.python.org/sitemap.xml",
@@ -540,12 +530,12 @@ class TestIngestSitemapIntegration:
         assert result["collection"] == "docs.python.org"
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_handles_ingest_failure(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
     ) -> None:
         from quarry.ingestion.pipeline import ingest_sitemap
@@ -554,7 +544,7 @@ class TestIngestSitemapIntegration:
             SitemapEntry(loc="https://example.com/good", lastmod=None),
             SitemapEntry(loc="https://example.com/bad", lastmod=None),
         ]
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
 
         def _side_effect(
             url: str, *args: object, **kwargs: object
@@ -1099,12 +1089,12 @@ class TestBulkIngestSsrfGate:
     """
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_internal_entry_dropped_batch_continues(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
@@ -1121,7 +1111,7 @@ class TestBulkIngestSsrfGate:
             SitemapEntry(loc="https://safe.example/page", lastmod=None),
             SitemapEntry(loc="https://internal.example/secret", lastmod=None),
         ]
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -1137,12 +1127,12 @@ class TestBulkIngestSsrfGate:
         assert "https://internal.example/secret" not in fetched
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_limit_delivers_limit_safe_pages_despite_early_internal(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
@@ -1166,7 +1156,7 @@ class TestBulkIngestSsrfGate:
             SitemapEntry(loc="https://safe.example/b", lastmod=None),
             SitemapEntry(loc="https://safe.example/c", lastmod=None),
         ]
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
@@ -1183,12 +1173,12 @@ class TestBulkIngestSsrfGate:
         assert "https://internal.example/secret" not in fetched
 
     @patch("quarry.ingestion.pipeline.ingest_url")
-    @patch("quarry.db.chunk_catalog.ChunkCatalog.list_documents")
+    @patch("quarry.db.chunk_catalog.ChunkCatalog.document_timestamps")
     @patch("quarry.sitemap.SitemapDiscovery.discover_urls")
     def test_after_filter_reports_post_gate_count(
         self,
         mock_discover: MagicMock,
-        mock_list_docs: MagicMock,
+        mock_timestamps: MagicMock,
         mock_ingest: MagicMock,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
@@ -1206,7 +1196,7 @@ class TestBulkIngestSsrfGate:
             SitemapEntry(loc="https://internal.example/secret", lastmod=None),
             SitemapEntry(loc="https://safe.example/b", lastmod=None),
         ]
-        mock_list_docs.return_value = []
+        mock_timestamps.return_value = {}
         mock_ingest.return_value = _MOCK_RESULT
 
         result = ingest_sitemap(
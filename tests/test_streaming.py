@@ -0,0 +1,82 @@
+"""Tests for DocumentStreamer window embedding (in-window text dedup)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import numpy as np
+
+from quarry.ingestion.streaming import DocumentStreamer
+from quarry.models import Chunk
+
+
+def _chunk(idx: int, text: str) -> Chunk:
+    return Chunk(
+        document_name="test.pdf",
+        document_path="/tmp/test.pdf",
+        collection="default",
+        page_number=1,
+        total_pages=1,
+        chunk_index=idx,
+        text=text,
+        page_raw_text=text,
+        page_type="text",
+        source_format=".pdf",
+        ingestion_timestamp=datetime.now(tz=UTC),
+    )
+
+
+class _RecordingEmbedder:
+    """Fake embedder: records each call and returns a distinct vector per text."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self._assigned: dict[str, int] = {}
+
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        rows = []
+        for text in texts:
+            self._assigned.setdefault(text, len(self._assigned))
+            rows.append([float(self._assigned[text])] * 4)
+        return np.asarray(rows, dtype=np.float32)
+
+
+class TestEmbedWindow:
+    def test_duplicate_texts_embed_once(self) -> None:
+        embedder = _RecordingEmbedder()
+        batch = [
+            _chunk(0, "header"),
+            _chunk(1, "body one"),
+            _chunk(2, "header"),
+            _chunk(3, "body two"),
+        ]
+
+        vectors = DocumentStreamer._embed_window(embedder, batch)
+
+        assert embedder.calls == [["header", "body one", "body two"]]
+        assert vectors.shape == (4, 4)
+
+    def test_duplicate_rows_map_back_to_positions(self) -> None:
+        embedder = _RecordingEmbedder()
+        batch = [
+            _chunk(0, "header"),
+            _chunk(1, "body"),
+            _chunk(2, "header"),
+        ]
+
+        vectors = DocumentStreamer._embed_window(embedder, batch)
+
+        np.testing.assert_array_equal(vectors[0], vectors[2])
+        assert not np.array_equal(vectors[0], vectors[1])
+
+    def test_distinct_texts_pass_through_unchanged(self) -> None:
+        embedder = _RecordingEmbedder()
+        batch = [_chunk(i, f"text {i}") for i in range(3)]
+
+        vectors = DocumentStreamer._embed_window(embedder, batch)
+
+        assert embedder.calls == [["text 0", "text 1", "text 2"]]
+        np.testing.assert_array_equal(
+            vectors, embedder.embed_texts([f"text {i}" for i in range(3)])
+        )